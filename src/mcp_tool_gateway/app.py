@@ -1,7 +1,10 @@
 from __future__ import annotations
+import json
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-
-import httpx
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
@@ -9,57 +12,97 @@ from starlette.requests import Request
 from starlette.responses import Response
 
 from mcp_tool_gateway.config import get_settings
-from mcp_tool_gateway.server import mcp
+from mcp_tool_gateway.server import mcp, register_all_tools
+from mcp_tool_gateway.services.web_service import close_http_client
 
 from mcp_tool_gateway.routes.auth import router as auth_router
 from mcp_tool_gateway.routes.tools import router as tools_router
 
-from mcp_tool_gateway.middleware import McpAuthGateMiddleware
-from mcp_tool_gateway.security import require_scopes, verify_jwt_from_header
+from mcp_tool_gateway.middleware import McpAuthGateMiddleware, MountAlias, PyinstrumentMiddleware
 
+# Paths (outside MCP_MOUNT_PATH) that serve the MCP message endpoint.
+MESSAGES_ALIAS_PATHS = ("/messages", "/messages/")
 
-def create_app() -> FastAPI:
-    settings = get_settings()
 
-    app = FastAPI(title=settings.app_name)
+class _MessagesAlias:
+    """ASGI callable that serves POST /messages straight from the mounted MCP app.
+
+    The scope is rewritten as if the request had arrived at ``{mount}/messages/``,
+    so the MCP app routes it exactly like a mounted request. There is no extra
+    HTTP round-trip, body buffering or header copying involved.
+    """
+
+    def __init__(self, app: Callable, *, mount_path: str) -> None:
+        self.app = app
+        self.mount_path = mount_path.rstrip("/")
+        self.messages_path = f"{self.mount_path}/messages/"
+        self.raw_messages_path = self.messages_path.encode("utf-8")
 
-    @app.get("/health")
-    def health():
-        return {
+    async def __call__(self, scope, receive, send) -> None:
+        root_path = scope.get("root_path", "")
+        scope = dict(scope)
+        scope["path"] = root_path + self.messages_path
+        scope["raw_path"] = self.raw_messages_path
+        scope["root_path"] = root_path + self.mount_path
+        await self.app(scope, receive, send)
+
+
+def _make_health_endpoint(settings: Any) -> Callable[[Request], Awaitable[Response]]:
+    """Build a plain Starlette endpoint for /health (hit by every readiness probe).
+
+    Everything except `time` is static, so the JSON body up to the timestamp is
+    encoded once here; each probe only appends the current time. Serving it as a
+    Starlette route skips FastAPI's dependency resolution and response encoding.
+    """
+    static = json.dumps(
+        {
             "ok": True,
             "app_name": settings.app_name,
             "mcp_mount_path": settings.mcp_mount_path,
             "auth_enabled": settings.mcp_enable_auth,
-            "time": datetime.now(timezone.utc).isoformat()
-        }
+        },
+        separators=(",", ":"),
+    )
+    body_prefix = (static[:-1] + ',"time":"').encode("utf-8")
+
+    # `time` has second granularity: the body is rebuilt at most once per second.
+    cache = {"sec": -1, "body": b""}
+
+    async def health(_: Request) -> Response:
+        now = int(time.time())
+        if now != cache["sec"]:
+            stamp = datetime.fromtimestamp(now, timezone.utc).isoformat()
+            cache["sec"], cache["body"] = now, body_prefix + stamp.encode("ascii") + b'"}'
+        return Response(cache["body"], media_type="application/json")
+
+    return health
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Register tools once the server is starting, not at import time.
+    # (Registration is cheap in-memory work, so there is nothing to parallelize.)
+    register_all_tools()
+    yield
+    await close_http_client()
+
+
+def create_app() -> FastAPI:
+    settings = get_settings()
+
+    app = FastAPI(title=settings.app_name, lifespan=lifespan)
+
+    app.add_route("/health", _make_health_endpoint(settings), methods=["GET"])
 
     # Register auth endpoint (it will error if auth is disabled, which is fine)
     app.include_router(auth_router)
     app.include_router(tools_router)
 
-    # Streaming-safe auth gate for MCP routes
-    if settings.mcp_enable_auth:
-        app.add_middleware(McpAuthGateMiddleware, settings=settings)
-
     # Mount MCP SSE app
     # NOTE: FastMCP also supports streamable_http_app() in newer versions; SSE is the most common.
-    #
-    # IMPORTANT COMPAT:
-    # Many clients (including our integration tests) assume the MCP SSE app is available
-    # at the conventional "/mcp" prefix (i.e., /mcp/sse). You may configure a different
-    # mount path via MCP_MOUNT_PATH, but for compatibility we also expose the same MCP app
-    # under "/mcp". This does NOT remove or change existing behavior; it only adds an
-    # additional stable alias.
     mcp_app = mcp.sse_app()
-
-    # Primary mount (configurable)
     app.mount(settings.mcp_mount_path, mcp_app)
 
-    # Compatibility mount (stable default)
-    primary = settings.mcp_mount_path.rstrip("/") or "/"
-    if primary != "/mcp":
-        app.mount("/mcp", mcp_app)
-
     # ---------------------------------------------------------------------
     # Compatibility alias: /messages
     # ---------------------------------------------------------------------
@@ -69,51 +112,36 @@ def create_app() -> FastAPI:
     # (including `initialize`) to be sent to a non-existent route and hang.
     #
     # To preserve the current workflow (MCP mounted at MCP_MOUNT_PATH) while
-    # remaining compatible with both endpoint styles, we provide a thin in-process
-    # ASGI proxy for POST /messages that forwards to the mounted MCP app.
-    @app.post("/messages")
-    async def mcp_messages_alias(request: Request) -> Response:
-        # If auth is enabled, enforce the same checks as the MCP mount path.
-        # (Middleware only guards paths under MCP_MOUNT_PATH.)
-        if settings.mcp_enable_auth:
-            authorization = request.headers.get("authorization", "")
-            claims = verify_jwt_from_header(authorization=authorization, settings=settings)
-            require_scopes(claims=claims, settings=settings)
-
-        body = await request.body()
-
-        # Preserve query params (FastMCP uses them for session routing).
-        # Example: POST /messages?session_id=...  (dropping this breaks initialize())
-        upstream_path = request.url.path
-        if request.url.query:
-            upstream_path = f"{upstream_path}?{request.url.query}"
-
-        # Forward the request to the MCP ASGI app without making a network call.
-        transport = httpx.ASGITransport(app=mcp_app)
-        headers = dict(request.headers)
-        headers.pop("host", None)
-
-        async with httpx.AsyncClient(transport=transport, base_url="http://mcp") as client:
-            upstream = await client.post(
-                upstream_path,
-                content=body,
-                headers=headers,
-                timeout=None,  # MCP message handling should control its own timing
-            )
-
-        # Drop hop-by-hop headers that shouldn't be forwarded back.
-        hop_by_hop = {
-            "connection",
-            "keep-alive",
-            "proxy-authenticate",
-            "proxy-authorization",
-            "te",
-            "trailers",
-            "transfer-encoding",
-            "upgrade",
-        }
-        out_headers = {k: v for k, v in upstream.headers.items() if k.lower() not in hop_by_hop}
-        return Response(content=upstream.content, status_code=upstream.status_code, headers=out_headers)
+    # remaining compatible with both endpoint styles, POST /messages is routed
+    # directly into the mounted MCP app (no in-process proxy hop).
+    messages_alias = _MessagesAlias(mcp_app, mount_path=settings.mcp_mount_path)
+    for path in MESSAGES_ALIAS_PATHS:
+        app.add_route(path, messages_alias, methods=["POST"], include_in_schema=False)
+
+    # Opt-in profiler (?profile=1); production traffic never goes through it.
+    # Added before the auth gate so the gate wraps it: unauthenticated requests are
+    # rejected before anything is profiled.
+    if settings.profiling_enabled:
+        app.add_middleware(PyinstrumentMiddleware)
+
+    # Streaming-safe auth gate for MCP routes (including the aliases above)
+    if settings.mcp_enable_auth:
+        app.add_middleware(McpAuthGateMiddleware, settings=settings, extra_paths=MESSAGES_ALIAS_PATHS)
+
+    # IMPORTANT COMPAT:
+    # Many clients (including our integration tests) assume the MCP SSE app is available
+    # at the conventional "/mcp" prefix (i.e., /mcp/sse). You may configure a different
+    # mount path via MCP_MOUNT_PATH, but for compatibility "/mcp/..." is also accepted and
+    # rewritten to MCP_MOUNT_PATH. This is a path rewrite rather than a second mount, and
+    # it is added last so it runs first (the auth gate only ever sees the real path).
+    #
+    # Compatibility note: because the MCP app only ever sees the real path, a client that
+    # connects to /mcp/sse is told to POST to "{MCP_MOUNT_PATH}/messages/" (the old second
+    # mount advertised "/mcp/messages/"). A reverse proxy that only forwards /mcp/* must
+    # also forward MCP_MOUNT_PATH (or /messages) for those clients.
+    primary = settings.mcp_mount_path.rstrip("/") or "/"
+    if primary != "/mcp":
+        app.add_middleware(MountAlias, alias="/mcp", target=settings.mcp_mount_path)
 
     # Nice JSON error for 404 under root
     @app.exception_handler(404)
@@ -123,4 +151,17 @@ def create_app() -> FastAPI:
     return app
 
 
-app = create_app()
+# Run with: uvicorn mcp_tool_gateway.app:create_app --factory
+# Nothing is built at import time, so importing this module (e.g. in a preloading
+# master process) is cheap and cannot fail on app construction.
+@lru_cache(maxsize=1)
+def app_factory() -> FastAPI:
+    """Process-wide cached app instance (backs the legacy `mcp_tool_gateway.app:app`)."""
+    return create_app()
+
+
+def __getattr__(name: str):
+    # Back-compat: `uvicorn mcp_tool_gateway.app:app` still works, built lazily on access.
+    if name == "app":
+        return app_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 import jwt  # PyJWT
 
@@ -24,47 +25,68 @@ class JwtToken(AccessToken):
     expires_at: int  # epoch seconds
 
 
+@lru_cache(maxsize=2048)
+def _decode_cached(token: str, secret: str, algorithm: str, audience: str, issuer: str) -> Tuple[str, int, Tuple[str, ...]]:
+    """Decode and validate a JWT, returning (sub, exp, scopes).
+
+    Invalid tokens raise and are therefore never cached. A cached token may have
+    expired since it was decoded, so callers must still check `exp`.
+    """
+    payload = jwt.decode(
+        token,
+        secret,
+        algorithms=[algorithm],
+        audience=audience,
+        issuer=issuer,
+        options={
+            "require": ["exp", "iat", "sub"],
+        },
+    )
+
+    # scopes: accept either space-separated string ("a b") or list ["a","b"]
+    raw_scopes = payload.get("scope") or payload.get("scopes")
+    if isinstance(raw_scopes, str):
+        scopes = tuple(raw_scopes.split())  # split() already drops empty parts
+    elif isinstance(raw_scopes, list):
+        scopes = tuple(str(s) for s in raw_scopes if s)
+    else:
+        scopes = ()
+
+    exp = int(payload.get("exp", 0) or 0)
+    sub = str(payload.get("sub") or "")
+    return sub, exp, scopes
+
+
 class JwtTokenVerifier(TokenVerifier):
-    """Verifies Bearer JWTs for the MCP server."""
+    """Verifies Bearer JWTs for the MCP server.
+
+    Clients resend the same token for its whole lifetime, so successful decodes are
+    cached (see `_decode_cached`); expiry and required scopes are checked per call.
+    """
 
     async def verify_token(self, token: str) -> Optional[AccessToken]:
         settings = get_settings()
 
         try:
-            payload = jwt.decode(
+            sub, exp, scopes = _decode_cached(
                 token,
                 settings.mcp_jwt_secret,
-                algorithms=[settings.mcp_jwt_algorithm],
-                audience=settings.mcp_jwt_audience,
-                issuer=settings.mcp_jwt_issuer,
-                options={
-                    "require": ["exp", "iat", "sub"],
-                },
+                settings.mcp_jwt_algorithm,
+                settings.mcp_jwt_audience,
+                settings.mcp_jwt_issuer,
             )
         except Exception:
             return None
 
-        # scopes: accept either space-separated string ("a b") or list ["a","b"]
-        raw_scopes = payload.get("scope") or payload.get("scopes") or ""
-        if isinstance(raw_scopes, str):
-            scopes = [s for s in raw_scopes.split() if s]
-        elif isinstance(raw_scopes, list):
-            scopes = [str(s) for s in raw_scopes if s]
-        else:
-            scopes = []
-
-        exp = int(payload.get("exp", 0) or 0)
-        sub = str(payload.get("sub") or "")
-
-        if not sub or exp <= int(time.time()):
+        if not sub or exp <= time.time_ns() // 1_000_000_000:
             return None
 
         # enforce required scopes (if configured)
-        required = settings.required_scopes_list
-        if required and not set(required).issubset(set(scopes)):
+        required = settings.mcp_required_scopes_set
+        if required and not required.issubset(scopes):
             return None
 
-        return JwtToken(client_id=sub, scopes=scopes, expires_at=exp)
+        return JwtToken(client_id=sub, scopes=list(scopes), expires_at=exp)
 
 
 def issue_jwt_for_client(
@@ -75,7 +97,7 @@ def issue_jwt_for_client(
 ) -> str:
     """Create a signed JWT for MCP access."""
     settings = get_settings()
-    now = int(time.time())
+    now = time.time_ns() // 1_000_000_000
 
     ttl = int(ttl_seconds or settings.mcp_jwt_ttl_seconds)
     exp = now + ttl
@@ -97,6 +119,4 @@ def issue_jwt_for_client(
 def is_valid_api_key(api_key: str) -> bool:
     """Simple check for token-issuing endpoint."""
     settings = get_settings()
-    if not settings.mcp_api_keys:
-        return False
-    return api_key in set(settings.mcp_api_keys)
+    return api_key in settings.mcp_api_keys
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import re
 from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
-from pydantic import Field, HttpUrl
+from pydantic import Field, HttpUrl, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,8 +15,8 @@ def _split_csv(value: str | None) -> list[str]:
     s = str(value).strip()
     if not s:
         return []
-    parts = re.split(r"[\s,]+", s)
-    return [p for p in (p.strip() for p in parts) if p]
+    # Commas and any whitespace are both separators; str.split() drops empty parts.
+    return s.replace(",", " ").split()
 
 
 class Settings(BaseSettings):
@@ -68,18 +68,48 @@ class Settings(BaseSettings):
     web_fetch_timeout_s: float = Field(15.0, alias="WEB_FETCH_TIMEOUT_S")
     web_max_bytes: int = Field(1_000_000, alias="WEB_MAX_BYTES")
     web_user_agent: str = Field("mcp-tool-gateway/0.1", alias="WEB_USER_AGENT")
+    # Connection pool of the shared web_fetch client
+    web_max_connections: int = Field(1000, alias="WEB_MAX_CONNECTIONS")
+    web_max_keepalive_connections: int = Field(100, alias="WEB_MAX_KEEPALIVE_CONNECTIONS")
+    web_keepalive_expiry_s: float = Field(15.0, alias="WEB_KEEPALIVE_EXPIRY_S")
+    # Identical searches within this window are served from memory. 0 disables the cache.
+    web_search_cache_ttl_s: float = Field(60.0, alias="WEB_SEARCH_CACHE_TTL_S")
+
+    # -----------------------------
+    # Diagnostics
+    # -----------------------------
+    # Enables ?profile=1 request profiling (requires the `profiling` extra). Dev only.
+    profiling_enabled: bool = Field(False, alias="PROFILING_ENABLED")
+
+    # Parsed forms of the *_raw lists above, built once in model_post_init.
+    # They are read on every auth check, so they must not be re-split per access.
+    _api_keys: frozenset[str] = PrivateAttr(default_factory=frozenset)
+    _required_scopes: tuple[str, ...] = PrivateAttr(default=())
+    _required_scopes_set: frozenset[str] = PrivateAttr(default_factory=frozenset)
+    _allowed_domains: tuple[str, ...] = PrivateAttr(default=())
+
+    def model_post_init(self, __context: Any) -> None:
+        self._api_keys = frozenset(_split_csv(self.mcp_api_keys_raw))
+        self._required_scopes = tuple(_split_csv(self.mcp_required_scopes_raw))
+        self._required_scopes_set = frozenset(self._required_scopes)
+        self._allowed_domains = tuple(d.lower().strip(".") for d in _split_csv(self.web_allowed_domains_raw))
+
+    @property
+    def mcp_api_keys(self) -> frozenset[str]:
+        return self._api_keys
 
     @property
-    def mcp_api_keys(self) -> list[str]:
-        return _split_csv(self.mcp_api_keys_raw)
+    def mcp_required_scopes(self) -> tuple[str, ...]:
+        """Required scopes in configured order (used as the default scopes of issued tokens)."""
+        return self._required_scopes
 
     @property
-    def mcp_required_scopes(self) -> list[str]:
-        return _split_csv(self.mcp_required_scopes_raw)
+    def mcp_required_scopes_set(self) -> frozenset[str]:
+        return self._required_scopes_set
 
-    def allowed_domains(self) -> list[str]:
+    def allowed_domains(self) -> tuple[str, ...]:
         """Allowlist of domains for web fetching. Empty means deny all."""
-        return [d.lower().strip(".") for d in _split_csv(self.web_allowed_domains_raw)]
+        return self._allowed_domains
 
     def files_base_path(self) -> Path:
         return Path(self.files_base_dir).expanduser()
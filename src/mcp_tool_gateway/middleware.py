@@ -1,6 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Callable
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from urllib.parse import parse_qsl
+
+import orjson
+
+from fastapi import HTTPException, status
 
 from mcp_tool_gateway.security import require_scopes, verify_jwt_from_header
 
@@ -14,30 +21,180 @@ class McpAuthGateMiddleware:
 
     Behavior:
     - If settings.mcp_enable_auth is False: no auth checks (same as your current env toggle).
-    - If True: requests under settings.mcp_mount_path require Authorization: Bearer <jwt>
-      and scope validation.
+    - If True: requests under settings.mcp_mount_path (and any `extra_paths` aliases of
+      the MCP app) require Authorization: Bearer <jwt> and scope validation.
+    - Auth failures are answered directly at the ASGI level (JSON body, same shape as
+      FastAPI's HTTPException handler) because exceptions raised from user middleware
+      never reach FastAPI's exception handlers.
+    - Verified claims are cached per Authorization header (the signature is part of the
+      key), so an MCP session sending many messages with the same token pays for JWT
+      verification once. `exp` is still checked on every hit.
     """
 
-    def __init__(self, app: Callable, *, settings: Any) -> None:
+    def __init__(self, app: Callable, *, settings: Any, extra_paths: Iterable[str] = ()) -> None:
         self.app = app
         self.settings = settings
+        # Hot-path values are frozen into plain attributes (no settings lookups per request)
+        self._auth_enabled = bool(settings.mcp_enable_auth)
+        # Protected paths (mount path + `extra_paths` aliases) are computed once: a request is
+        # gated if its path equals one of them or lives below it ("/mcp" and "/mcp/sse"
+        # match, "/mcpx" does not).
+        bases = {p.rstrip("/") for p in (settings.mcp_mount_path, *extra_paths)}
+        self._exact_paths = frozenset(bases)
+        self._prefix_paths = tuple(f"{b}/" for b in bases)
+        self._verify_cached = lru_cache(maxsize=4096)(self._verify)
 
     async def __call__(self, scope, receive, send) -> None:
-        # Only handle HTTP requests
-        if scope["type"] != "http":
+        # Only handle HTTP requests, and only when auth is enabled
+        if scope["type"] != "http" or not self._auth_enabled:
             await self.app(scope, receive, send)
             return
 
-        path = scope.get("path", "") or ""
+        # Match on the decoded path (what the router dispatches on), not raw_path:
+        # a percent-encoded raw_path such as "/m%63p/sse" would otherwise slip past.
+        path = scope.get("path", "")
+
+        # Enforce auth only if the request is under MCP mount path (or an alias)
+        if not (path in self._exact_paths or path.startswith(self._prefix_paths)):
+            await self.app(scope, receive, send)
+            return
 
-        # Enforce auth only if enabled AND request is under MCP mount path
-        if self.settings.mcp_enable_auth and path.startswith(self.settings.mcp_mount_path):
-            # ASGI headers are List[Tuple[bytes, bytes]]
-            headers = dict(scope.get("headers") or [])
-            auth_bytes = headers.get(b"authorization", b"")
-            authorization = auth_bytes.decode("utf-8", errors="ignore")
+        # ASGI headers are List[Tuple[bytes, bytes]] with lowercased names; scan for the
+        # one we need instead of building a dict. Header values are latin-1 per ASGI.
+        authorization = ""
+        for name, value in scope.get("headers") or ():
+            if name == b"authorization":
+                authorization = value.decode("latin-1")
+                break
 
-            claims = verify_jwt_from_header(authorization=authorization, settings=self.settings)
+        try:
+            claims, exp = self._verify_cached(authorization)
+            if exp <= time.time():
+                raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired")
             require_scopes(claims=claims, settings=self.settings)
+        except HTTPException as exc:
+            await _send_json_error(send, status_code=exc.status_code, detail=exc.detail)
+            return
+
+        await self.app(scope, receive, send)
+
+    def _verify(self, authorization: str) -> Tuple[Dict[str, Any], int]:
+        """Uncached verification; failures raise and are therefore never cached."""
+        claims = verify_jwt_from_header(authorization=authorization, settings=self.settings)
+        return claims, int(claims["exp"])
+
 
+class MountAlias:
+    """
+    Pure ASGI path rewrite: serve `alias/...` from the app mounted at `target/...`.
+
+    Used instead of mounting the same ASGI app twice, which would add a second full
+    router entry that Starlette walks on every request.
+    """
+
+    def __init__(self, app: Callable, *, alias: str, target: str) -> None:
+        self.app = app
+        self.alias = alias.rstrip("/")
+        self.alias_prefix = f"{self.alias}/"
+        self.target = target.rstrip("/")
+        self.target_prefix = f"{self.target}/"
+        self.raw_alias = self.alias.encode("utf-8")
+        self.raw_target = self.target.encode("utf-8")
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] in ("http", "websocket"):
+            path = scope.get("path", "")
+            # A target nested under the alias (e.g. "/mcp/v1") is already routable as-is.
+            if (path == self.alias or path.startswith(self.alias_prefix)) and not (
+                self.target and (path == self.target or path.startswith(self.target_prefix))
+            ):
+                scope = dict(scope)
+                scope["path"] = (self.target + path[len(self.alias):]) or "/"
+                # Swap the prefix on the original bytes so percent-encoding is preserved.
+                raw_path = scope.get("raw_path")
+                if raw_path is not None and raw_path.startswith(self.raw_alias):
+                    scope["raw_path"] = (self.raw_target + raw_path[len(self.raw_alias):]) or b"/"
+                else:
+                    scope["raw_path"] = scope["path"].encode("utf-8")
         await self.app(scope, receive, send)
+
+
+class PyinstrumentMiddleware:
+    """
+    Opt-in request profiler (pure ASGI, development only).
+
+    Only installed when settings.profiling_enabled is True. Even then, only requests
+    carrying `?profile=1` are profiled: if the app answers 2xx its response is discarded
+    and the pyinstrument HTML report is returned instead; any other status (errors,
+    redirects) is passed through unchanged. All other requests pass straight through.
+
+    Do not use it on streaming endpoints (e.g. /mcp/sse): the report is only rendered
+    once the wrapped response has finished.
+    """
+
+    def __init__(self, app: Callable, *, interval: float = 0.001) -> None:
+        try:
+            from pyinstrument import Profiler
+        except ImportError as e:  # pragma: no cover
+            raise RuntimeError(
+                "PROFILING_ENABLED=true requires pyinstrument. Install it with: pip install -e .[profiling]"
+            ) from e
+
+        self.app = app
+        self.interval = interval
+        self._profiler_cls = Profiler
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not _wants_profile(scope.get("query_string", b"")):
+            await self.app(scope, receive, send)
+            return
+
+        messages: List[Dict[str, Any]] = []
+
+        async def buffer_send(message) -> None:
+            messages.append(message)
+
+        profiler = self._profiler_cls(interval=self.interval, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, buffer_send)
+        finally:
+            profiler.stop()
+
+        status_code = messages[0].get("status", 200) if messages else 500
+        if not 200 <= status_code < 300:
+            for message in messages:
+                await send(message)
+            return
+
+        body = profiler.output_html().encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/html; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+def _wants_profile(query_string: bytes) -> bool:
+    if b"profile" not in query_string:
+        return False
+    return ("profile", "1") in parse_qsl(query_string.decode("latin-1"))
+
+
+async def _send_json_error(send, *, status_code: int, detail: Any) -> None:
+    """Send a minimal JSON error response without going through Starlette."""
+    body = orjson.dumps({"detail": detail})
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode("latin-1")),
+    ]
+    if status_code == 401:
+        headers.append((b"www-authenticate", b"Bearer"))
+    await send({"type": "http.response.start", "status": status_code, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
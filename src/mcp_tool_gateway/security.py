@@ -11,7 +11,7 @@ from mcp_tool_gateway.config import Settings
 
 def api_key_is_allowed(api_key: str, settings: Settings) -> bool:
     api_key = (api_key or "").strip()
-    return bool(api_key) and api_key in set(settings.mcp_api_keys)
+    return bool(api_key) and api_key in settings.mcp_api_keys
 
 
 def issue_jwt(*, subject: str, scopes: list[str], settings: Settings) -> str:
@@ -29,27 +29,32 @@ def issue_jwt(*, subject: str, scopes: list[str], settings: Settings) -> str:
     return jwt.encode(payload, settings.mcp_jwt_secret, algorithm=settings.mcp_jwt_algorithm)
 
 
+_BEARER_PREFIX = "bearer "
+
+# One configured decoder reused for every request (options are fixed).
+_jwt_decoder = jwt.PyJWT(options={"require": ["exp", "iat", "iss", "aud", "sub"]})
+
+
 def _extract_bearer_token(authorization: Optional[str]) -> str:
     if not authorization:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing Authorization header")
-    parts = authorization.split()
-    if len(parts) != 2 or parts[0].lower() != "bearer":
+    # Compare the 7-char scheme prefix directly instead of split()-ing the whole header
+    token = authorization[7:].strip() if authorization[:7].lower() == _BEARER_PREFIX else ""
+    if not token:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid Authorization header")
-    return parts[1].strip()
+    return token
 
 
 def verify_jwt_from_header(*, authorization: Optional[str], settings: Settings) -> Dict[str, Any]:
     token = _extract_bearer_token(authorization)
     try:
-        claims = jwt.decode(
+        return _jwt_decoder.decode(
             token,
             settings.mcp_jwt_secret,
             algorithms=[settings.mcp_jwt_algorithm],
             audience=settings.mcp_jwt_audience,
             issuer=settings.mcp_jwt_issuer,
-            options={"require": ["exp", "iat", "iss", "aud", "sub"]},
         )
-        return claims
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired")
     except jwt.InvalidTokenError:
@@ -57,12 +62,11 @@ def verify_jwt_from_header(*, authorization: Optional[str], settings: Settings)
 
 
 def require_scopes(*, claims: Dict[str, Any], settings: Settings) -> None:
-    required = set(settings.mcp_required_scopes)
+    required = settings.mcp_required_scopes_set
     if not required:
         return
 
-    scope_str = str(claims.get("scope") or "")
-    token_scopes = set([s for s in scope_str.split() if s])
-    missing = required - token_scopes
+    scope_str = claims.get("scope") or ""
+    missing = required.difference(str(scope_str).split())
     if missing:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=f"Missing scopes: {', '.join(sorted(missing))}")
@@ -1,6 +1,6 @@
 from mcp_tool_gateway.mcp_instance import mcp
 from mcp_tool_gateway.tools import register_all_tools
 
-register_all_tools()
+# Tools are registered during app startup (see app.lifespan), not at import time.
 
-__all__ = ["mcp"]
+__all__ = ["mcp", "register_all_tools"]
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import Any
-from urllib.parse import urlparse
 
 import httpx
 from duckduckgo_async_search import top_n_result
@@ -9,6 +10,38 @@ from duckduckgo_async_search import top_n_result
 from mcp_tool_gateway.config import settings
 
 
+# Shared HTTP client for web_fetch: keeps connections (TCP/TLS) alive across calls.
+# Created lazily on first use and closed by the app lifespan (see close_http_client).
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            follow_redirects=True,
+            headers={"User-Agent": settings.web_user_agent},
+            timeout=settings.web_fetch_timeout_s,
+            limits=httpx.Limits(
+                max_connections=settings.web_max_connections,
+                max_keepalive_connections=settings.web_max_keepalive_connections,
+                keepalive_expiry=settings.web_keepalive_expiry_s,
+            ),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared web_fetch client (called on app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+_URL_PREFIXES = ("http://", "https://")
+
+
 def _url_allowed(url: str) -> bool:
     """Return True if URL is allowed to be fetched.
 
@@ -16,8 +49,17 @@ def _url_allowed(url: str) -> bool:
     - In production, consider enabling an allowlist.
     - For this project, **all http/https URLs are allowed** per requirements.
     """
-    parsed = urlparse(url)
-    return parsed.scheme in ("http", "https") and bool(parsed.hostname)
+    if not url[:8].lower().startswith(_URL_PREFIXES):
+        return False
+    # Only "has a hostname" is left to check: cut out the authority by hand instead
+    # of building a full urlsplit() result.
+    authority = url.partition("://")[2]
+    for sep in "/?#":
+        authority = authority.partition(sep)[0]
+    host = authority.rpartition("@")[2]
+    if not host.startswith("["):  # IPv6 literals contain ':' themselves
+        host = host.partition(":")[0]
+    return bool(host)
 
 
 async def web_fetch(
@@ -45,46 +87,94 @@ async def web_fetch(
     max_bytes = int(max_bytes or settings.web_max_bytes)
     max_chars = int(max_chars or 8000)
 
-    headers = {"User-Agent": settings.web_user_agent}
-    async with httpx.AsyncClient(follow_redirects=True, headers=headers, timeout=timeout_s) as client:
-        r = await client.get(url)
-        content = r.content[:max_bytes]
-        # Best-effort decode
-        try:
-            text = content.decode(r.encoding or "utf-8", errors="replace")
-        except Exception:
-            text = content.decode("utf-8", errors="replace")
-        text = text[:max_chars]
-        return {
-            "url": url,
-            "status_code": r.status_code,
-            "text": text,
-            "headers": {
-                "content-type": r.headers.get("content-type", ""),
-                "content-length": r.headers.get("content-length", ""),
-            },
-        }
+    # Stream the body and stop reading at max_bytes instead of downloading it all.
+    async with _get_client().stream("GET", url, timeout=timeout_s) as r:
+        buf = bytearray()
+        async for chunk in r.aiter_bytes():
+            buf += chunk
+            if len(buf) >= max_bytes:
+                break
+    del buf[max_bytes:]  # in-place trim (no copy when already under the cap)
+    # Best-effort decode. httpx only reports known codecs in r.encoding and
+    # errors="replace" cannot raise, so one decode suffices.
+    text = buf.decode(r.encoding or "utf-8", errors="replace")[:max_chars]
+    return {
+        "url": url,
+        "status_code": r.status_code,
+        "text": text,
+        "headers": {
+            "content-type": r.headers.get("content-type", ""),
+            "content-length": r.headers.get("content-length", ""),
+        },
+    }
+
+
+# Short-lived search cache: (normalized query, max_results) -> (expires_at, results).
+# Concurrent identical searches share one in-flight upstream call.
+_SEARCH_CACHE_MAX = 1024
+_search_cache: dict[tuple[str, int], tuple[float, list[dict[str, Any]]]] = {}
+_search_inflight: dict[tuple[str, int], asyncio.Task[list[dict[str, Any]]]] = {}
 
 
 async def web_search_ddg(query: str, max_results: int = 5) -> list[dict[str, Any]]:
     """DuckDuckGo web search via `duckduckgo-async-search`.
 
+    Non-empty results are cached for WEB_SEARCH_CACHE_TTL_S seconds per
+    (query, max_results). Empty results (usually upstream rate limiting) are not.
+
     Returns list of dicts: rank, title, url, snippet.
     """
     # Clamp for safety
     max_results = max(1, min(int(max_results), 20))
+
+    ttl = settings.web_search_cache_ttl_s
+    if ttl <= 0:
+        return await _search_ddg_uncached(query, max_results)
+
+    key = (" ".join(query.split()).lower(), max_results)
+    hit = _search_cache.get(key)
+    if hit is None or hit[0] <= time.monotonic():
+        task = _search_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(_search_and_cache(key, query, max_results, ttl))
+            _search_inflight[key] = task
+            task.add_done_callback(lambda _: _search_inflight.pop(key, None))
+        # shield: a cancelled caller must not cancel the search other callers share
+        results = await asyncio.shield(task)
+    else:
+        results = hit[1]
+
+    # Copies, so callers cannot mutate the cached entries
+    return [dict(item) for item in results]
+
+
+async def _search_and_cache(
+    key: tuple[str, int], query: str, max_results: int, ttl: float
+) -> list[dict[str, Any]]:
+    results = await _search_ddg_uncached(query, max_results)
+    if not results:
+        return results
+    if len(_search_cache) >= _SEARCH_CACHE_MAX:
+        now = time.monotonic()
+        for k in [k for k, (expires_at, _) in _search_cache.items() if expires_at <= now]:
+            del _search_cache[k]
+        if len(_search_cache) >= _SEARCH_CACHE_MAX:
+            del _search_cache[next(iter(_search_cache))]  # oldest insertion
+    _search_cache[key] = (time.monotonic() + ttl, results)
+    return results
+
+
+async def _search_ddg_uncached(query: str, max_results: int) -> list[dict[str, Any]]:
     results = await top_n_result(query, max_results)
 
-    out: list[dict[str, Any]] = []
-    for i, item in enumerate(results, start=1):
-        if not isinstance(item, dict):
-            continue
-        out.append(
-            {
-                "rank": i,
-                "title": item.get("title") or "",
-                "url": item.get("href") or item.get("url") or "",
-                "snippet": item.get("body") or item.get("snippet") or "",
-            }
-        )
-    return out
+    # Ranks follow upstream positions, so a skipped non-dict item leaves a gap (as before).
+    return [
+        {
+            "rank": i,
+            "title": item.get("title") or "",
+            "url": item.get("href") or item.get("url") or "",
+            "snippet": item.get("body") or item.get("snippet") or "",
+        }
+        for i, item in enumerate(results, start=1)
+        if isinstance(item, dict)
+    ]
@@ -7,7 +7,7 @@ Best practice used here:
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Type
+from typing import Dict, Optional, Type
 
 from mcp_tool_gateway.tools._base import BaseTool, ToolSpec
 from mcp_tool_gateway.tools.add import AddTool
@@ -21,27 +21,29 @@ _TOOL_CLASSES: tuple[Type[BaseTool], ...] = (
     WebSearchTool,
 )
 
-# Lazy-initialized caches (no registry.py needed)
-_TOOLS: List[BaseTool] = []
+# Built once by register_all_tools() and never mutated afterwards (no registry.py needed)
+_TOOLS: tuple[BaseTool, ...] = ()
+_SPECS: tuple[ToolSpec, ...] = ()
 _TOOL_BY_NAME: Dict[str, BaseTool] = {}
 
 
 def register_all_tools() -> None:
     """Instantiate and register all tools exactly once."""
-    global _TOOLS, _TOOL_BY_NAME
+    global _TOOLS, _SPECS, _TOOL_BY_NAME
     if _TOOLS:
         return
 
-    for cls in _TOOL_CLASSES:
-        tool = cls()
+    tools = tuple(cls() for cls in _TOOL_CLASSES)
+    for tool in tools:
         tool.register()
-        _TOOLS.append(tool)
-        _TOOL_BY_NAME[tool.spec.name] = tool
+    _SPECS = tuple(tool.spec for tool in tools)
+    _TOOL_BY_NAME = {spec.name: tool for spec, tool in zip(_SPECS, tools)}
+    _TOOLS = tools
 
 
-def list_tool_specs() -> list[ToolSpec]:
+def list_tool_specs() -> tuple[ToolSpec, ...]:
     register_all_tools()
-    return [t.spec for t in _TOOLS]
+    return _SPECS
 
 
 def get_tool(tool_name: str) -> Optional[BaseTool]:
@@ -4,6 +4,7 @@ import asyncio
 import inspect
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import (
     Any,
     AsyncIterator,
@@ -11,6 +12,7 @@ from typing import (
     Dict,
     Iterator,
     Optional,
+    Tuple,
     TypeVar,
     cast,
 )
@@ -19,12 +21,29 @@ from mcp_tool_gateway.mcp_instance import mcp
 
 F = TypeVar("F", bound=Callable[..., Any])
 
-# Cache the *raw Python callable* behind each tool name so unit tests / internal calls
-# can invoke logic without going through MCP transport.
-_TOOL_CALLABLES: Dict[str, Callable[..., Any]] = {}
 
+class _CallKind(IntEnum):
+    """How a tool callable must be invoked (classified once, at registration)."""
 
-@dataclass(frozen=True)
+    SYNC = 0
+    ASYNC = 1
+    ASYNC_GEN = 2
+
+
+def _call_kind(fn: Callable[..., Any]) -> _CallKind:
+    if inspect.isasyncgenfunction(fn):
+        return _CallKind.ASYNC_GEN
+    if inspect.iscoroutinefunction(fn):
+        return _CallKind.ASYNC
+    return _CallKind.SYNC
+
+
+# Cache the *raw Python callable* behind each tool name (with its call kind) so unit
+# tests / internal calls can invoke logic without going through MCP transport.
+_TOOL_CALLABLES: Dict[str, Tuple[Callable[..., Any], _CallKind]] = {}
+
+
+@dataclass(frozen=True, slots=True)
 class ToolSpec:
     """Metadata for an MCP tool (for discovery endpoints)."""
 
@@ -58,21 +77,21 @@ class BaseTool(ABC):
     # ---------------------------
     # Internal helpers
     # ---------------------------
-    def _ensure_fn(self) -> Callable[..., Any]:
+    def _ensure_fn(self) -> Tuple[Callable[..., Any], _CallKind]:
         """Ensure tool is registered and a callable exists in cache."""
-        fn = _TOOL_CALLABLES.get(self.spec.name)
-        if fn is None:
+        entry = _TOOL_CALLABLES.get(self.spec.name)
+        if entry is None:
             # run registration so tool_decorator caches the function
             self.register()
-            fn = _TOOL_CALLABLES.get(self.spec.name)
+            entry = _TOOL_CALLABLES.get(self.spec.name)
 
-        if fn is None:
+        if entry is None:
             raise RuntimeError(
                 f"Tool '{self.spec.name}' did not register a callable. "
                 "Ensure register() defines a function decorated with "
                 "tool_decorator(name=self.spec.name, ...)."
             )
-        return fn
+        return entry
 
     # ---------------------------
     # Public runners
@@ -83,8 +102,8 @@ class BaseTool(ABC):
         - If tool is `async def`, it is awaited.
         - If tool is sync `def`, it is executed in a worker thread so it won't block the event loop.
         """
-        fn = self._ensure_fn()
-        if inspect.iscoroutinefunction(fn):
+        fn, kind = self._ensure_fn()
+        if kind is _CallKind.ASYNC:
             return await fn(*args, **kwargs)
 
         # Sync tool: run in a thread for non-blocking behavior
@@ -96,8 +115,8 @@ class BaseTool(ABC):
         - Works only if the tool callable is sync.
         - Raises if the tool callable is async.
         """
-        fn = self._ensure_fn()
-        if inspect.iscoroutinefunction(fn):
+        fn, kind = self._ensure_fn()
+        if kind is _CallKind.ASYNC:
             raise RuntimeError(
                 f"Tool '{self.spec.name}' is async; use `await run(...)` instead."
             )
@@ -127,10 +146,10 @@ class BaseTool(ABC):
         For true token streaming, implement your tool as an async generator
         and `yield` chunks.
         """
-        fn = self._ensure_fn()
+        fn, kind = self._ensure_fn()
 
         # Case 1: async generator function
-        if inspect.isasyncgenfunction(fn):
+        if kind is _CallKind.ASYNC_GEN:
             agen = fn(*args, **kwargs)
             assert hasattr(agen, "__aiter__")
             async for item in cast(AsyncIterator[Any], agen):
@@ -138,7 +157,7 @@ class BaseTool(ABC):
             return
 
         # Case 2: coroutine function (async def that returns something)
-        if inspect.iscoroutinefunction(fn):
+        if kind is _CallKind.ASYNC:
             result = await fn(*args, **kwargs)
             async for item in _coerce_to_async_stream(result):
                 yield item
@@ -155,7 +174,8 @@ def tool_decorator(*, name: str, description: str):
     """Thin wrapper around `mcp.tool()` plus a callable cache for tests/internal runs.
 
     Keeps tool modules clean (they don't need to import `mcp`).
-    Also caches the raw Python callable under `name` so BaseTool.run* can invoke it.
+    Also caches the raw Python callable under `name` (classified sync/async/async-gen
+    once, here) so BaseTool.run* can invoke it without re-inspecting it per call.
     """
     mcp_deco = mcp.tool(name=name, description=description)  # type: ignore[arg-type]
 
@@ -164,7 +184,7 @@ def tool_decorator(*, name: str, description: str):
 
         # Cache the *original* function for unit tests / internal execution.
         # (Prefer raw fn over wrapped to avoid transport-specific wrappers.)
-        _TOOL_CALLABLES[name] = cast(Callable[..., Any], fn)
+        _TOOL_CALLABLES[name] = (cast(Callable[..., Any], fn), _call_kind(fn))
 
         # Return MCP's wrapped callable for proper MCP registration.
         return cast(F, wrapped)
@@ -3,13 +3,16 @@ from __future__ import annotations
 from mcp_tool_gateway.tools._base import BaseTool, ToolSpec, tool_decorator
 
 
+ADD_SPEC = ToolSpec(
+    name="add",
+    description="Return a + b (float).",
+)
+
+
 class AddTool(BaseTool):
     @property
     def spec(self) -> ToolSpec:
-        return ToolSpec(
-            name="add",
-            description="Return a + b (float).",
-        )
+        return ADD_SPEC
 
     def register(self) -> None:
         @tool_decorator(name=self.spec.name, description=self.spec.description)
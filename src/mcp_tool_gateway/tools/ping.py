@@ -3,13 +3,16 @@ from __future__ import annotations
 from mcp_tool_gateway.tools._base import BaseTool, ToolSpec, tool_decorator
 
 
+PING_SPEC = ToolSpec(
+    name="ping",
+    description="Simple connectivity test. Returns 'pong'.",
+)
+
+
 class PingTool(BaseTool):
     @property
     def spec(self) -> ToolSpec:
-        return ToolSpec(
-            name="ping",
-            description="Simple connectivity test. Returns 'pong'.",
-        )
+        return PING_SPEC
 
     def register(self) -> None:
         @tool_decorator(name=self.spec.name, description=self.spec.description)
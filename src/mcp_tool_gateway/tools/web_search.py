@@ -6,13 +6,16 @@ from mcp_tool_gateway.tools._base import BaseTool, ToolSpec, tool_decorator
 from mcp_tool_gateway.services.web_service import web_search_ddg
 
 
+WEB_SEARCH_SPEC = ToolSpec(
+    name="web_search",
+    description="Search the web using DuckDuckGo (duckduckgo-async-search).",
+)
+
+
 class WebSearchTool(BaseTool):
     @property
     def spec(self) -> ToolSpec:
-        return ToolSpec(
-            name="web_search",
-            description="Search the web using DuckDuckGo (duckduckgo-async-search).",
-        )
+        return WEB_SEARCH_SPEC
 
     def register(self) -> None:
         @tool_decorator(name=self.spec.name, description=self.spec.description)
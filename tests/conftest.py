@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Mapping
+
+import pytest
+
+
+# Hook added in pytest-asyncio 1.4 (the dev pin); optionalhook keeps older installs importable
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config: Any, item: Any) -> Mapping[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run async tests on uvloop when it is installed (a runtime dependency off Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
@@ -7,7 +7,7 @@ Assumptions:
 - Tests connect over MCP SSE and call real tools.
 
 This file is designed to NEVER hang indefinitely:
-- All MCP operations are wrapped in asyncio.wait_for timeouts.
+- All MCP operations are wrapped in asyncio.timeout() deadlines.
 - SSE context is always closed in finally blocks.
 """
 
@@ -16,11 +16,14 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+import random
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 import httpx
 import pytest
+import pytest_asyncio
 from dotenv import dotenv_values
 
 from mcp import ClientSession
@@ -31,19 +34,19 @@ from mcp.client.sse import sse_client
 # Config loading (env -> .env -> .env.example)
 # ---------------------------
 
+@lru_cache(maxsize=None)
+def _env_file(path: str) -> dict[str, Optional[str]]:
+    """Parse a dotenv file once (missing file -> empty)."""
+    p = Path(path)
+    return dict(dotenv_values(p)) if p.exists() else {}
+
+
 def _load_value(key: str, default: str = "") -> str:
     if os.getenv(key):
         return os.getenv(key) or default
 
-    env_path = Path(".env")
-    if env_path.exists():
-        v = dotenv_values(env_path).get(key)
-        if v:
-            return str(v)
-
-    ex_path = Path(".env.example")
-    if ex_path.exists():
-        v = dotenv_values(ex_path).get(key)
+    for path in (".env", ".env.example"):
+        v = _env_file(path).get(key)
         if v:
             return str(v)
 
@@ -78,28 +81,26 @@ def _first_api_key() -> str:
     return parts[0] if parts else "dev-key-1"
 
 
-async def _http_get_json(path: str) -> dict[str, Any]:
-    async with httpx.AsyncClient(timeout=HTTP_TIMEOUT_S) as client:
-        r = await client.get(f"{BASE_URL}{path}")
-        r.raise_for_status()
-        return r.json()
+async def _http_get_json(client: httpx.AsyncClient, path: str) -> dict[str, Any]:
+    r = await client.get(f"{BASE_URL}{path}")
+    r.raise_for_status()
+    return r.json()
 
 
-async def _maybe_get_bearer_token(health: dict[str, Any]) -> Optional[str]:
+async def _maybe_get_bearer_token(client: httpx.AsyncClient, health: dict[str, Any]) -> Optional[str]:
     """
     Only request a token if the server reports auth_enabled=true in /health.
     """
     if not bool(health.get("auth_enabled", False)):
         return None
 
-    async with httpx.AsyncClient(timeout=HTTP_TIMEOUT_S) as client:
-        r = await client.post(
-            f"{BASE_URL}/auth/token",
-            headers={"X-API-Key": _first_api_key()},
-            json={"subject": "pytest"},
-        )
-        r.raise_for_status()
-        return r.json()["access_token"]
+    r = await client.post(
+        f"{BASE_URL}/auth/token",
+        headers={"X-API-Key": _first_api_key()},
+        json={"subject": "pytest"},
+    )
+    r.raise_for_status()
+    return r.json()["access_token"]
 
 
 def _extract_text(result: Any) -> str:
@@ -112,12 +113,7 @@ def _extract_text(result: Any) -> str:
     content = getattr(result, "content", None)
     if not content:
         return ""
-    out: list[str] = []
-    for blk in content:
-        t = getattr(blk, "text", None)
-        if isinstance(t, str):
-            out.append(t)
-    return "".join(out).strip()
+    return "".join(t for blk in content if isinstance(t := getattr(blk, "text", None), str)).strip()
 
 
 def _try_parse_json(text: str) -> Any:
@@ -133,21 +129,20 @@ async def _wait(coro, *, timeout_s: float, label: str):
     """
     Wrap an awaitable with a timeout so pytest never hangs.
     """
+    # asyncio.timeout (not wait_for) keeps the awaitable in the current task, which the
+    # anyio cancel scopes inside sse_client/ClientSession require on enter/exit.
     try:
-        return await asyncio.wait_for(coro, timeout=timeout_s)
-    except asyncio.TimeoutError as e:
+        async with asyncio.timeout(timeout_s):
+            return await coro
+    except TimeoutError as e:
         raise AssertionError(f"Timed out after {timeout_s:.0f}s while waiting for: {label}") from e
 
 
-async def _open_mcp_session() -> tuple[ClientSession, Any]:
+async def _open_mcp_session(headers: Optional[dict[str, str]]) -> tuple[ClientSession, Any]:
     """
     Opens SSE connection + initializes MCP session.
     Returns (session, sse_ctx) where sse_ctx must be closed.
     """
-    health = await _http_get_json("/health")
-    token = await _maybe_get_bearer_token(health)
-    headers = {"Authorization": f"Bearer {token}"} if token else None
-
     # Open SSE stream
     sse_ctx = sse_client(MCP_SSE_URL, headers=headers)
     read, write = await _wait(
@@ -156,7 +151,13 @@ async def _open_mcp_session() -> tuple[ClientSession, Any]:
         label=f"open SSE stream {MCP_SSE_URL}",
     )
 
-    session = ClientSession(read, write)
+    # Entering the session starts its receive loop; without it initialize() never
+    # sees the server's reply.
+    session = await _wait(
+        ClientSession(read, write).__aenter__(),
+        timeout_s=MCP_STEP_TIMEOUT_S,
+        label="start MCP ClientSession",
+    )
 
     # Initialize MCP
     await _wait(
@@ -168,7 +169,12 @@ async def _open_mcp_session() -> tuple[ClientSession, Any]:
     return session, sse_ctx
 
 
-async def _close_mcp_session(sse_ctx: Any) -> None:
+async def _close_mcp_session(session: ClientSession, sse_ctx: Any) -> None:
+    await _wait(
+        session.__aexit__(None, None, None),
+        timeout_s=MCP_STEP_TIMEOUT_S,
+        label="close MCP ClientSession",
+    )
     await _wait(
         sse_ctx.__aexit__(None, None, None),
         timeout_s=MCP_STEP_TIMEOUT_S,
@@ -184,28 +190,51 @@ async def _retry(coro_factory, *, attempts: int = 3, delay_s: float = 1.5):
         except Exception as e:
             last = e
             if i < attempts - 1:
-                await asyncio.sleep(delay_s)
+                # Exponential backoff with jitter (DDG rate limits are the usual failure)
+                await asyncio.sleep(delay_s * (2**i) + random.uniform(0, 0.5))
     assert last is not None
     raise last
 
 
+# ---------------------------
+# Fixtures
+# ---------------------------
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client():
+    """One keep-alive HTTP client shared by every test (tests run on the session loop)."""
+    async with httpx.AsyncClient(
+        timeout=HTTP_TIMEOUT_S,
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=15.0),
+    ) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mcp_headers(http_client) -> Optional[dict[str, str]]:
+    """Headers for MCP connections; /health is checked and a token fetched once per session."""
+    health = await _http_get_json(http_client, "/health")
+    token = await _maybe_get_bearer_token(http_client, health)
+    return {"Authorization": f"Bearer {token}"} if token else None
+
+
 # ---------------------------
 # Tests (NO MOCKS)
 # ---------------------------
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_health_ok():
-    health = await _http_get_json("/health")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_health_ok(http_client):
+    health = await _http_get_json(http_client, "/health")
     assert health.get("ok") is True
     assert "auth_enabled" in health
     assert "mcp_mount_path" in health
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_tools_http_list_ok():
-    tools = await _http_get_json("/tools")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tools_http_list_ok(http_client):
+    tools = await _http_get_json(http_client, "/tools")
     assert isinstance(tools, list)
     names = {t.get("name") for t in tools if isinstance(t, dict)}
     assert "ping" in names
@@ -214,9 +243,9 @@ async def test_tools_http_list_ok():
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_mcp_list_tools_over_sse():
-    session, sse_ctx = await _open_mcp_session()
+@pytest.mark.asyncio(loop_scope="session")
+async def test_mcp_list_tools_over_sse(mcp_headers):
+    session, sse_ctx = await _open_mcp_session(mcp_headers)
     try:
         tools = await _wait(
             session.list_tools(),
@@ -228,13 +257,13 @@ async def test_mcp_list_tools_over_sse():
         assert "add" in tool_names
         assert "web_search" in tool_names
     finally:
-        await _close_mcp_session(sse_ctx)
+        await _close_mcp_session(session, sse_ctx)
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_mcp_ping_tool():
-    session, sse_ctx = await _open_mcp_session()
+@pytest.mark.asyncio(loop_scope="session")
+async def test_mcp_ping_tool(mcp_headers):
+    session, sse_ctx = await _open_mcp_session(mcp_headers)
     try:
         result = await _wait(
             session.call_tool("ping", arguments={}),
@@ -244,13 +273,13 @@ async def test_mcp_ping_tool():
         text = _extract_text(result).lower()
         assert "pong" in text
     finally:
-        await _close_mcp_session(sse_ctx)
+        await _close_mcp_session(session, sse_ctx)
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_mcp_add_tool():
-    session, sse_ctx = await _open_mcp_session()
+@pytest.mark.asyncio(loop_scope="session")
+async def test_mcp_add_tool(mcp_headers):
+    session, sse_ctx = await _open_mcp_session(mcp_headers)
     try:
         result = await _wait(
             session.call_tool("add", arguments={"a": 2, "b": 3}),
@@ -260,17 +289,39 @@ async def test_mcp_add_tool():
         text = _extract_text(result)
         assert "5" in text
     finally:
-        await _close_mcp_session(sse_ctx)
+        await _close_mcp_session(session, sse_ctx)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="session")
+async def test_mcp_batched_calls_in_one_session(mcp_headers):
+    """Independent calls share one session and run concurrently (session setup dominates)."""
+    session, sse_ctx = await _open_mcp_session(mcp_headers)
+    try:
+        tools, ping, add = await _wait(
+            asyncio.gather(
+                session.list_tools(),
+                session.call_tool("ping", arguments={}),
+                session.call_tool("add", arguments={"a": 2, "b": 3}),
+            ),
+            timeout_s=MCP_STEP_TIMEOUT_S,
+            label="MCP list_tools + ping + add (gathered)",
+        )
+        assert {"ping", "add", "web_search"} <= {t.name for t in tools.tools}
+        assert "pong" in _extract_text(ping).lower()
+        assert "5" in _extract_text(add)
+    finally:
+        await _close_mcp_session(session, sse_ctx)
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_mcp_web_search_tool_returns_results():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_mcp_web_search_tool_returns_results(mcp_headers):
     """
     Real network call. No mocks.
     Retried because DDG/network can be transiently flaky.
     """
-    session, sse_ctx = await _open_mcp_session()
+    session, sse_ctx = await _open_mcp_session(mcp_headers)
     try:
         async def _call():
             return await _wait(
@@ -293,4 +344,4 @@ async def test_mcp_web_search_tool_returns_results():
             # If returned as non-JSON text, still require non-empty
             assert isinstance(text, str) and len(text) > 0
     finally:
-        await _close_mcp_session(sse_ctx)
+        await _close_mcp_session(session, sse_ctx)
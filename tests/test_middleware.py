@@ -0,0 +1,183 @@
+"""
+Tests for the pure ASGI middlewares in middleware.py.
+
+Each middleware wraps a tiny echo app that reports the path it was routed to,
+and is driven in-process with Starlette's TestClient (no running server).
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import jwt
+import pytest
+from starlette.responses import JSONResponse
+from starlette.testclient import TestClient
+
+from mcp_tool_gateway.config import Settings
+from mcp_tool_gateway.middleware import McpAuthGateMiddleware, MountAlias
+from mcp_tool_gateway.security import issue_jwt
+
+MESSAGES_ALIAS_PATHS = ("/messages", "/messages/")
+
+
+async def _echo(scope, receive, send) -> None:
+    """Answer 200 with the path (and raw_path) the request finally arrived at."""
+    body = {"path": scope["path"], "raw_path": scope.get("raw_path", b"").decode("latin-1")}
+    await JSONResponse(body)(scope, receive, send)
+
+
+def _settings(**env: Any) -> Settings:
+    values = {
+        "MCP_ENABLE_AUTH": True,
+        "MCP_MOUNT_PATH": "/mcp",
+        "MCP_JWT_SECRET": "test-secret-that-is-at-least-32-bytes-long",
+        "MCP_REQUIRED_SCOPES": "mcp:tools",
+        **env,
+    }
+    return Settings(_env_file=None, **values)
+
+
+def _bearer(settings: Settings, scopes: list[str] | None = None) -> dict[str, str]:
+    token = issue_jwt(subject="client", scopes=["mcp:tools"] if scopes is None else scopes, settings=settings)
+    return {"Authorization": f"Bearer {token}"}
+
+
+# ---------------------------
+# McpAuthGateMiddleware
+# ---------------------------
+
+@pytest.fixture
+def settings() -> Settings:
+    return _settings()
+
+
+@pytest.fixture
+def gate(settings) -> McpAuthGateMiddleware:
+    return McpAuthGateMiddleware(_echo, settings=settings, extra_paths=MESSAGES_ALIAS_PATHS)
+
+
+@pytest.fixture
+def client(gate) -> TestClient:
+    return TestClient(gate)
+
+
+def _assert_rejected(response, status_code: int, detail: str) -> None:
+    assert response.status_code == status_code
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"detail": detail}
+    if status_code == 401:
+        assert response.headers["www-authenticate"] == "Bearer"
+    else:
+        assert "www-authenticate" not in response.headers
+
+
+def test_gate_allows_valid_token(client, settings):
+    response = client.get("/mcp/sse", headers=_bearer(settings))
+    assert response.status_code == 200
+    assert response.json()["path"] == "/mcp/sse"
+
+
+@pytest.mark.parametrize(
+    "headers, detail",
+    [
+        ({}, "Missing Authorization header"),
+        ({"Authorization": "Basic abc"}, "Invalid Authorization header"),
+        ({"Authorization": "Bearer "}, "Invalid Authorization header"),
+        ({"Authorization": "Bearer not-a-jwt"}, "Invalid token"),
+    ],
+)
+def test_gate_rejects_missing_or_malformed_token(client, headers, detail):
+    _assert_rejected(client.get("/mcp/sse", headers=headers), 401, detail)
+
+
+def test_gate_rejects_token_signed_with_another_secret(client):
+    other = _settings(MCP_JWT_SECRET="another-secret-that-is-also-32-bytes-long")
+    _assert_rejected(client.get("/mcp/sse", headers=_bearer(other)), 401, "Invalid token")
+
+
+def test_gate_rejects_insufficient_scopes(client, settings):
+    response = client.get("/mcp/sse", headers=_bearer(settings, scopes=["other"]))
+    _assert_rejected(response, 403, "Missing scopes: mcp:tools")
+
+
+def test_gate_rechecks_expiry_of_cached_token(client, gate, settings):
+    headers = _bearer(_settings(MCP_JWT_TTL_SECONDS=2))
+    exp = jwt.decode(headers["Authorization"][7:], options={"verify_signature": False})["exp"]
+
+    assert client.get("/mcp/sse", headers=headers).status_code == 200
+    time.sleep(max(0.0, exp - time.time()) + 0.05)
+    response = client.get("/mcp/sse", headers=headers)
+
+    _assert_rejected(response, 401, "Token expired")
+    # The second request was answered from the claims cache, not by re-decoding the JWT
+    assert gate._verify_cached.cache_info().hits == 1
+
+
+@pytest.mark.parametrize("path", ["/mcp", "/mcp/", "/mcp/sse", "/messages", "/messages/", "/messages/x"])
+def test_gate_covers_mount_and_message_aliases(client, path):
+    _assert_rejected(client.post(path), 401, "Missing Authorization header")
+
+
+@pytest.mark.parametrize("path", ["/mcpx", "/mcpx/sse", "/messagesx", "/health", "/"])
+def test_gate_ignores_paths_outside_the_mount(client, path):
+    assert client.get(path).status_code == 200
+
+
+def test_gate_matches_percent_encoded_paths(client):
+    # "/m%63p/sse" decodes to "/mcp/sse": routed to the MCP app, so it must be gated
+    _assert_rejected(client.get("/m%63p/sse"), 401, "Missing Authorization header")
+
+
+def test_gate_is_a_no_op_when_auth_is_disabled():
+    settings = _settings(MCP_ENABLE_AUTH=False)
+    client = TestClient(McpAuthGateMiddleware(_echo, settings=settings, extra_paths=MESSAGES_ALIAS_PATHS))
+    assert client.get("/mcp/sse").status_code == 200
+
+
+# ---------------------------
+# MountAlias
+# ---------------------------
+
+def _alias_client(target: str) -> TestClient:
+    return TestClient(MountAlias(_echo, alias="/mcp", target=target))
+
+
+@pytest.mark.parametrize(
+    "target, path, expected",
+    [
+        ("/gw", "/mcp/sse", "/gw/sse"),
+        ("/gw", "/mcp", "/gw"),
+        ("/gw/", "/mcp/messages/", "/gw/messages/"),
+        ("/", "/mcp/sse", "/sse"),
+        # Nested target: paths already under it must not be rewritten a second time
+        ("/mcp/v1", "/mcp/sse", "/mcp/v1/sse"),
+        ("/mcp/v1", "/mcp/v1/messages/", "/mcp/v1/messages/"),
+        ("/mcp/v1", "/mcp/v1", "/mcp/v1"),
+    ],
+)
+def test_mount_alias_rewrites_into_target(target, path, expected):
+    body = _alias_client(target).get(path).json()
+    assert body == {"path": expected, "raw_path": expected}
+
+
+@pytest.mark.parametrize("path", ["/mcpx", "/mcpx/sse", "/health", "/gw/sse"])
+def test_mount_alias_leaves_other_paths_alone(path):
+    body = _alias_client("/gw").get(path).json()
+    assert body == {"path": path, "raw_path": path}
+
+
+def test_mount_alias_keeps_percent_encoding_in_raw_path():
+    body = _alias_client("/gw").get("/mcp/a%20b%2Fc").json()
+    assert body == {"path": "/gw/a b/c", "raw_path": "/gw/a%20b%2Fc"}
+
+
+def test_mount_alias_runs_before_the_gate():
+    # create_app() order: the alias rewrites first, so the gate sees the real mount path
+    settings = _settings(MCP_MOUNT_PATH="/gw")
+    gate = McpAuthGateMiddleware(_echo, settings=settings, extra_paths=MESSAGES_ALIAS_PATHS)
+    client = TestClient(MountAlias(gate, alias="/mcp", target="/gw"))
+
+    _assert_rejected(client.get("/mcp/sse"), 401, "Missing Authorization header")
+    assert client.get("/mcp/sse", headers=_bearer(settings)).json()["path"] == "/gw/sse"
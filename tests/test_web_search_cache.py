@@ -0,0 +1,127 @@
+"""
+Tests for the DuckDuckGo result cache in services/web_service.py.
+
+The upstream search (`top_n_result`) is replaced with a stub so the cache
+behaviour can be checked without network access or rate limits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from mcp_tool_gateway.config import settings
+from mcp_tool_gateway.services import web_service
+
+
+class _Upstream:
+    """Stand-in for `top_n_result` that records calls and replays queued answers."""
+
+    def __init__(self, *answers: Any) -> None:
+        self.answers = list(answers)
+        self.calls = 0
+        self.gate: asyncio.Event | None = None
+
+    async def __call__(self, query: str, max_results: int) -> list[dict[str, Any]]:
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        answer = self.answers.pop(0) if len(self.answers) > 1 else self.answers[0]
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+
+_HIT = [{"title": "Example", "href": "https://example.com", "body": "snippet"}]
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache(monkeypatch):
+    monkeypatch.setattr(settings, "web_search_cache_ttl_s", 60.0)
+    web_service._search_cache.clear()
+    web_service._search_inflight.clear()
+    yield
+    web_service._search_cache.clear()
+    web_service._search_inflight.clear()
+
+
+def _stub(monkeypatch, *answers: Any) -> _Upstream:
+    upstream = _Upstream(*answers)
+    monkeypatch.setattr(web_service, "top_n_result", upstream)
+    return upstream
+
+
+async def test_repeat_query_is_served_from_cache(monkeypatch):
+    upstream = _stub(monkeypatch, _HIT)
+
+    first = await web_service.web_search_ddg("python  asyncio", 3)
+    second = await web_service.web_search_ddg("Python asyncio", 3)
+
+    assert upstream.calls == 1
+    assert first == second == [{"rank": 1, "title": "Example", "url": "https://example.com", "snippet": "snippet"}]
+
+
+async def test_cached_results_cannot_be_mutated_by_callers(monkeypatch):
+    _stub(monkeypatch, _HIT)
+
+    first = await web_service.web_search_ddg("q", 3)
+    first[0]["title"] = "changed"
+
+    assert (await web_service.web_search_ddg("q", 3))[0]["title"] == "Example"
+
+
+async def test_entry_expires_after_ttl(monkeypatch):
+    monkeypatch.setattr(settings, "web_search_cache_ttl_s", 0.05)
+    upstream = _stub(monkeypatch, _HIT)
+
+    await web_service.web_search_ddg("q", 3)
+    await asyncio.sleep(0.1)
+    await web_service.web_search_ddg("q", 3)
+
+    assert upstream.calls == 2
+
+
+async def test_ttl_zero_disables_cache(monkeypatch):
+    monkeypatch.setattr(settings, "web_search_cache_ttl_s", 0)
+    upstream = _stub(monkeypatch, _HIT)
+
+    await web_service.web_search_ddg("q", 3)
+    await web_service.web_search_ddg("q", 3)
+
+    assert upstream.calls == 2
+    assert not web_service._search_cache
+
+
+async def test_concurrent_identical_queries_share_one_upstream_call(monkeypatch):
+    upstream = _stub(monkeypatch, _HIT)
+    upstream.gate = asyncio.Event()
+
+    pending = asyncio.gather(*(web_service.web_search_ddg("q", 3) for _ in range(5)))
+    await asyncio.sleep(0)
+    upstream.gate.set()
+    results = await pending
+
+    assert upstream.calls == 1
+    assert all(r == results[0] for r in results)
+    assert not web_service._search_inflight
+
+
+async def test_empty_results_are_not_cached(monkeypatch):
+    upstream = _stub(monkeypatch, [], _HIT)
+
+    assert await web_service.web_search_ddg("q", 3) == []
+    assert await web_service.web_search_ddg("q", 3) != []
+    assert upstream.calls == 2
+
+
+async def test_upstream_error_propagates_and_is_not_cached(monkeypatch):
+    upstream = _stub(monkeypatch, RuntimeError("rate limited"), _HIT)
+
+    with pytest.raises(RuntimeError, match="rate limited"):
+        await web_service.web_search_ddg("q", 3)
+    assert not web_service._search_inflight
+
+    assert await web_service.web_search_ddg("q", 3) != []
+    assert upstream.calls == 2